@@ -1,18 +1,161 @@
-import os, json, shutil, datetime, argparse
+import os, json, shutil, datetime, argparse, heapq
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import numpy as np
 import pandas as pd
 
-def pct_missing(s: pd.Series) -> float:
-    if s.dtype == "object":
-        empty = s.fillna("").astype(str).str.strip().eq("")
-        return float(empty.mean() * 100)
-    return float(s.isna().mean() * 100)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _ID_DTYPE = "string[pyarrow]"
+except ImportError:
+    pa = pc = None
+    _ID_DTYPE = "string"
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # fast JSON emission for gap_report/backlog
+except ImportError:
+    orjson = None
+
+
+def _dump_json(path, obj):
+    """Serialize in one buffer with orjson when available; stdlib fallback."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def _score_loop(a, e, fm, fc, t1, t2, out):
+    # Fused scoring kernel: deficits vs targets plus focus boosts in one pass.
+    for i in range(a.shape[0]):
+        s = 0.0
+        d1 = t1 - a[i]
+        if d1 > 0:
+            s += d1
+        d2 = t2 - e[i]
+        if d2 > 0:
+            s += 2.0 * d2
+        if fm[i]:
+            s += 100.0
+        if fc[i]:
+            s += 30.0
+        out[i] = s
+
+
+# JIT-compile the kernel when numba is available (cached across runs);
+# otherwise score_into falls back to in-place numpy below.
+_score_kernel = njit(cache=True)(_score_loop) if njit is not None else None
+
+
+def score_into(a, e, fm, fc, t1, t2, out):
+    """Write museum scores into `out` without allocating intermediate arrays."""
+    if _score_kernel is not None:
+        _score_kernel(a, e, fm, fc, t1, t2, out)
+        return
+    out[:] = np.maximum(0, t1 - a)
+    out += 2 * np.maximum(0, t2 - e)
+    out += fm * 100.0
+    out += fc * 30.0
+
+def _fast_copy(src: str, dst: str):
+    """Copy via in-kernel sendfile(2); 1 MiB copyfileobj when unavailable."""
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        size = os.fstat(s.fileno()).st_size
+        offset = 0
+        try:
+            # sendfile may send fewer bytes than asked (signals, per-call
+            # caps on huge files) — advance the offset until done
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+        except (OSError, AttributeError):
+            if offset:
+                raise  # partial transfer: don't silently restart mid-file
+            shutil.copyfileobj(s, d, length=1 << 20)
+    shutil.copystat(src, dst)
+
+
+def _snapshot(src: str, dst: str):
+    """Hard-link the snapshot when possible (O(1) metadata); else copy."""
+    try:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    """Read with the pyarrow engine (vectorized parser) when available."""
+    try:
+        return pd.read_csv(path, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
+
+
+def missingness(df: pd.DataFrame) -> dict:
+    """
+    Per-column missingness %, computed block-wise: one isna pass for the
+    non-string columns, one fused strip/len mask over the string block,
+    instead of three materializations per column.
+    """
+    if not len(df):
+        # zero rows: every column is 0.0 missing, matching the Arrow path
+        return {col: 0.0 for col in df.columns}
+
+    if pa is not None:
+        # full sweep in Arrow: is_null / trim+length are SIMD kernels
+        t = pa.Table.from_pandas(df)
+        out = {}
+        for name, col in zip(t.column_names, t.columns):
+            if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+                # or_kleene: null-is-missing must win over the null the
+                # length test yields on those same rows
+                m = pc.or_kleene(pc.is_null(col),
+                                 pc.equal(pc.utf8_length(pc.utf8_trim_whitespace(col)), 0))
+            else:
+                m = pc.is_null(col)
+            mean = pc.mean(pc.cast(m, pa.float64())).as_py()
+            out[name] = float(mean or 0.0) * 100
+        return out
+
+    out = {}
+    obj = df.select_dtypes(include=["object", "string"])
+    num = df.drop(columns=obj.columns)
+    if num.shape[1]:
+        out.update({col: float(v) for col, v in (num.isna().mean() * 100).items()})
+
+    # string-dtype columns: strip/len dispatch to vectorized (Arrow) kernels
+    str_block = obj.select_dtypes(include="string")
+    for col in str_block.columns:
+        s = str_block[col]
+        out[col] = float((s.isna() | (s.str.strip().str.len() == 0)).mean() * 100)
+
+    # plain object columns: fused np.char sweep over the filled ndarray
+    plain = obj.drop(columns=str_block.columns)
+    if plain.shape[1]:
+        arr = plain.fillna("").to_numpy(dtype=str)
+        mask = np.char.str_len(np.char.strip(arr)) == 0
+        out.update({col: float(v) for col, v in zip(plain.columns, mask.mean(axis=0) * 100)})
+    return {col: out[col] for col in df.columns}
 
 def run(seed_dir="data/seed", run_id=None,
         target_artworks_per_museum=100, target_exhibitions_per_museum=30,
         focus_museum_ids=None, focus_countries=None):
 
-    focus_museum_ids = focus_museum_ids or []
-    focus_countries = focus_countries or []
+    # hash the focus lists once; the scoring masks reuse them
+    focus_museum_ids = frozenset(map(str, focus_museum_ids or []))
+    focus_countries = frozenset(map(str, focus_countries or []))
 
     if not run_id:
         run_id = "run_" + datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -32,60 +175,65 @@ def run(seed_dir="data/seed", run_id=None,
         if not os.path.exists(p):
             raise FileNotFoundError(f"Missing required file: {p}")
 
-    dfs = {k: pd.read_csv(p) for k, p in paths.items()}
-
-    # snapshot
-    for _, p in paths.items():
-        shutil.copy2(p, os.path.join(run_dir, "copies", os.path.basename(p)))
+    # the csv parsers release the GIL, so the four reads (and the disk
+    # snapshots) overlap in one thread pool
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        futs = {k: ex.submit(_read_csv, p) for k, p in paths.items()}
+        snaps = [ex.submit(_snapshot, p, os.path.join(run_dir, "copies", os.path.basename(p)))
+                 for p in paths.values()]
+        dfs = {k: f.result() for k, f in futs.items()}
+        for s in snaps:
+            s.result()
 
     stats = {}
+    miss_by_table = {}
     for name, df in dfs.items():
-        miss = {col: pct_missing(df[col]) for col in df.columns}
+        miss = missingness(df)
+        miss_by_table[name] = miss
         stats[name] = {
             "rows": int(len(df)),
             "cols": int(df.shape[1]),
-            "missingness_pct": dict(sorted(miss.items(), key=lambda x: x[1], reverse=True))
+            "missingness_pct": miss  # kept unsorted; ordered once at emit time
         }
 
-    museums = dfs["museums"].copy()
-    artworks = dfs["artworks"].copy()
-    exhibitions = dfs["exhibitions"].copy()
-    artists = dfs["artists"].copy()
+    # no .copy(): the pre-mutation frames are already snapshotted to disk
+    museums = dfs["museums"]
+    artworks = dfs["artworks"]
+    exhibitions = dfs["exhibitions"]
+    artists = dfs["artists"]
 
-    # normalize ids
-    for df, col in [(museums, "museum_id"), (artworks, "museum_id"), (exhibitions, "museum_id")]:
+    # normalize ids once into a (pyarrow-backed) string dtype; downstream
+    # isin/merge work on these directly with no further .astype(str) copies
+    for df, col in [(museums, "museum_id"), (artworks, "museum_id"), (exhibitions, "museum_id"),
+                    (artworks, "artist_id"), (artists, "artist_id")]:
         if col in df.columns:
-            df[col] = df[col].astype(str)
-
-    if "artist_id" in artworks.columns:
-        artworks["artist_id"] = artworks["artist_id"].astype(str)
-    if "artist_id" in artists.columns:
-        artists["artist_id"] = artists["artist_id"].astype(str)
-
-    # counts by museum
-    if "museum_id" in artworks.columns:
-        art_counts = artworks.groupby("museum_id").size().rename("artworks_count").reset_index()
-    else:
-        art_counts = pd.DataFrame(columns=["museum_id", "artworks_count"])
-
-    if "museum_id" in exhibitions.columns:
-        exh_counts = exhibitions.groupby("museum_id").size().rename("exhibitions_count").reset_index()
-    else:
-        exh_counts = pd.DataFrame(columns=["museum_id", "exhibitions_count"])
+            df[col] = df[col].astype(_ID_DTYPE)
 
+    # counts by museum: one hashed value_counts pass per table, joined via map
+    # (no intermediate frames, no hash-join merges)
     if "museum_id" in museums.columns:
-        m = museums.merge(art_counts, on="museum_id", how="left").merge(exh_counts, on="museum_id", how="left")
-        m["artworks_count"] = m["artworks_count"].fillna(0).astype(int)
-        m["exhibitions_count"] = m["exhibitions_count"].fillna(0).astype(int)
+        art_counts = (artworks["museum_id"].value_counts()
+                      if "museum_id" in artworks.columns else pd.Series(dtype="int64"))
+        exh_counts = (exhibitions["museum_id"].value_counts()
+                      if "museum_id" in exhibitions.columns else pd.Series(dtype="int64"))
+        m = museums.assign(
+            artworks_count=museums["museum_id"].map(art_counts).fillna(0).astype("int32"),
+            exhibitions_count=museums["museum_id"].map(exh_counts).fillna(0).astype("int32"),
+        )
     else:
         m = pd.DataFrame()
 
     # artist coverage
     artist_cov = None
     if "artist_id" in artworks.columns and "artist_id" in artists.columns and len(artworks) > 0:
-        known = set(artists["artist_id"].dropna().astype(str).tolist())
         total = len(artworks)
-        ok = artworks["artist_id"].astype(str).isin(known).sum()
+        known = artists["artist_id"].dropna()
+        if pc is not None:
+            # C-level hash table via Arrow's is_in kernel; no Python set
+            matched = pc.is_in(pa.array(artworks["artist_id"]), value_set=pa.array(known))
+            ok = pc.sum(matched).as_py() or 0
+        else:
+            ok = artworks["artist_id"].isin(known).sum()
         artist_cov = {
             "artworks_total": int(total),
             "artist_match_count": int(ok),
@@ -93,54 +241,52 @@ def run(seed_dir="data/seed", run_id=None,
         }
     stats["artist_coverage"] = artist_cov
 
-    # backlog scoring
-    def boost(row):
-        b = 0
-        if focus_museum_ids and str(row.get("museum_id", "")) in set(focus_museum_ids):
-            b += 100
-        if focus_countries and str(row.get("country", "")) in set(focus_countries):
-            b += 30
-        return b
-
+    # backlog scoring (fused kernel: deficit vs targets plus focus boosts)
     museum_tasks = []
     if not m.empty:
-        for _, row in m.iterrows():
-            art_c = int(row.get("artworks_count", 0))
-            exh_c = int(row.get("exhibitions_count", 0))
-            score = 0
-            score += max(0, target_artworks_per_museum - art_c)
-            score += max(0, target_exhibitions_per_museum - exh_c) * 2
-            score += boost(row)
-            museum_tasks.append({
-                "type": "museum_enrichment",
-                "museum_id": str(row.get("museum_id", "")),
-                "museum_name": str(row.get("museum_name", "")) if "museum_name" in m.columns else "",
-                "country": str(row.get("country", "")) if "country" in m.columns else "",
-                "artworks_count": art_c,
-                "exhibitions_count": exh_c,
-                "score": float(score),
-                "targets": {
-                    "target_artworks_per_museum": target_artworks_per_museum,
-                    "target_exhibitions_per_museum": target_exhibitions_per_museum
-                }
-            })
-
-    museum_tasks = sorted(museum_tasks, key=lambda x: x["score"], reverse=True)
+        focus_mask_m = m["museum_id"].isin(focus_museum_ids).to_numpy()
+        focus_mask_c = (m["country"].isin(focus_countries).to_numpy()
+                        if "country" in m.columns else np.zeros(len(m), dtype=bool))
+        score = np.empty(len(m), dtype="float64")
+        score_into(
+            m["artworks_count"].to_numpy(), m["exhibitions_count"].to_numpy(),
+            focus_mask_m, focus_mask_c,
+            target_artworks_per_museum, target_exhibitions_per_museum, score,
+        )
 
-    # column-level tasks
+        targets = {
+            "target_artworks_per_museum": target_artworks_per_museum,
+            "target_exhibitions_per_museum": target_exhibitions_per_museum
+        }
+        tasks = pd.DataFrame({
+            "type": "museum_enrichment",
+            "museum_id": m["museum_id"].astype(str),
+            "museum_name": m["museum_name"].fillna("").astype(str) if "museum_name" in m.columns else "",
+            "country": m["country"].fillna("").astype(str) if "country" in m.columns else "",
+            "artworks_count": m["artworks_count"],
+            "exhibitions_count": m["exhibitions_count"],
+            "score": score,
+        })
+        museum_tasks = tasks.to_dict(orient="records")
+        for t in museum_tasks:
+            t["targets"] = targets
+
+    # column-level tasks: filter to the >=20% subset first, sort only that
     column_tasks = []
-    for table, meta in stats.items():
-        if not isinstance(meta, dict) or "missingness_pct" not in meta:
-            continue
-        for col, misspct in meta["missingness_pct"].items():
-            if float(misspct) >= 20:
-                column_tasks.append({
-                    "type": "column_fill_strategy",
-                    "table": table,
-                    "column": col,
-                    "missingness_pct": float(misspct)
-                })
-    column_tasks = sorted(column_tasks, key=lambda x: x["missingness_pct"], reverse=True)
+    for table, miss in miss_by_table.items():
+        high = {col: v for col, v in miss.items() if v >= 20}
+        for col, misspct in sorted(high.items(), key=itemgetter(1), reverse=True):
+            column_tasks.append({
+                "type": "column_fill_strategy",
+                "table": table,
+                "column": col,
+                "missingness_pct": float(misspct)
+            })
+
+    # top-k selection: O(N log 25) instead of sorting the full lists; the
+    # markdown report below reuses these already-ordered lists
+    top_museums = heapq.nlargest(25, museum_tasks, key=itemgetter("score"))
+    top_columns = heapq.nlargest(25, column_tasks, key=itemgetter("missingness_pct"))
 
     backlog = {
         "run_id": run_id,
@@ -148,43 +294,46 @@ def run(seed_dir="data/seed", run_id=None,
             "target_artworks_per_museum": target_artworks_per_museum,
             "target_exhibitions_per_museum": target_exhibitions_per_museum
         },
-        "top_museums_to_enrich": museum_tasks[:25],
-        "high_missing_columns": column_tasks[:25]
+        "top_museums_to_enrich": top_museums,
+        "high_missing_columns": top_columns
     }
 
-    with open(os.path.join(run_dir, "gap_report.json"), "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
-
-    with open(os.path.join(run_dir, "backlog.json"), "w", encoding="utf-8") as f:
-        json.dump(backlog, f, ensure_ascii=False, indent=2)
-
-    # markdown report
-    lines = []
-    lines.append(f"# Gap Report — {run_id}\n")
-    lines.append("## Table Sizes\n")
-    for t in ["museums", "artworks", "artists", "exhibitions"]:
-        if t in stats:
-            lines.append(f"- **{t}**: {stats[t]['rows']} rows, {stats[t]['cols']} cols")
-
-    lines.append("\n## Artist Coverage\n")
-    if artist_cov:
-        lines.append(f"- artworks_total: {artist_cov['artworks_total']}")
-        lines.append(f"- artist_match_rate: {artist_cov['artist_match_rate']:.2%}")
-    else:
-        lines.append("- artist coverage could not be computed (missing artist_id columns or empty table).")
-
-    lines.append("\n## Top Museums to Enrich (by score)\n")
-    for item in backlog["top_museums_to_enrich"][:10]:
-        lines.append(
-            f"- {item['museum_id']} | {item['museum_name']} | artworks={item['artworks_count']} | exhibitions={item['exhibitions_count']} | score={item['score']}"
-        )
-
-    lines.append("\n## Highest Missing Columns (>=20%)\n")
-    for item in backlog["high_missing_columns"][:10]:
-        lines.append(f"- {item['table']}.{item['column']}: {item['missingness_pct']:.1f}%")
-
-    with open(os.path.join(run_dir, "gap_report.md"), "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    # the sorted order is cosmetic, so apply it once here rather than at gather
+    for name in miss_by_table:
+        stats[name]["missingness_pct"] = dict(
+            sorted(miss_by_table[name].items(), key=itemgetter(1), reverse=True))
+
+    _dump_json(os.path.join(run_dir, "gap_report.json"), stats)
+    _dump_json(os.path.join(run_dir, "backlog.json"), backlog)
+
+    # markdown report, streamed to a 64 KiB-buffered handle: no lines list,
+    # no joined intermediate string
+    with open(os.path.join(run_dir, "gap_report.md"), "w", encoding="utf-8",
+              buffering=1 << 16) as f:
+        w = f.write
+        w(f"# Gap Report — {run_id}\n\n")
+        w("## Table Sizes\n\n")
+        for t in ["museums", "artworks", "artists", "exhibitions"]:
+            if t in stats:
+                w(f"- **{t}**: {stats[t]['rows']} rows, {stats[t]['cols']} cols\n")
+
+        w("\n## Artist Coverage\n\n")
+        if artist_cov:
+            w(f"- artworks_total: {artist_cov['artworks_total']}\n")
+            w(f"- artist_match_rate: {artist_cov['artist_match_rate']:.2%}\n")
+        else:
+            w("- artist coverage could not be computed (missing artist_id columns or empty table).\n")
+
+        # one itemgetter call per row instead of five dict lookups
+        w("\n## Top Museums to Enrich (by score)\n\n")
+        museum_fields = itemgetter("museum_id", "museum_name", "artworks_count", "exhibitions_count", "score")
+        for item in top_museums[:10]:
+            w("- {} | {} | artworks={} | exhibitions={} | score={}\n".format(*museum_fields(item)))
+
+        w("\n## Highest Missing Columns (>=20%)\n\n")
+        column_fields = itemgetter("table", "column", "missingness_pct")
+        for item in top_columns[:10]:
+            w("- {}.{}: {:.1f}%\n".format(*column_fields(item)))
 
     return run_dir
 